@@ -5,16 +5,33 @@ from mpl_toolkits.mplot3d import Axes3D
 
 # --- Functions from original visualizer.py ---
 
-def plot_feature_importance(importance_df):
+def plot_importance_comparison(importance_df):
     """
-    Creates a bar chart and returns the figure object.
+    Shows impurity and permutation importances side by side and returns the figure object.
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
-    sns.barplot(ax=ax, x='importance', y='feature', data=importance_df, hue='feature', palette='viridis', legend=False)
-    ax.set_title('Which Factor Decides the Race Winner?', fontsize=16)
-    ax.set_xlabel('Importance Score', fontsize=12)
-    ax.set_ylabel('Feature', fontsize=12)
-    plt.tight_layout()
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6), sharey=True)
+    order = importance_df.sort_values(by='importance', ascending=False)['feature']
+
+    sns.barplot(ax=axes[0], x='importance', y='feature', data=importance_df, order=order, hue='feature', palette='viridis', legend=False)
+    axes[0].set_title('Impurity Importance (Random Forest)', fontsize=14)
+    axes[0].set_xlabel('Importance Score', fontsize=12)
+    axes[0].set_ylabel('Feature', fontsize=12)
+
+    sns.barplot(ax=axes[1], x='permutation_importance', y='feature', data=importance_df, order=order, hue='feature', palette='viridis', legend=False)
+    axes[1].errorbar(
+        x=importance_df.set_index('feature').loc[order, 'permutation_importance'],
+        y=range(len(order)),
+        xerr=importance_df.set_index('feature').loc[order, 'permutation_std'],
+        fmt='none',
+        ecolor='black',
+        capsize=3
+    )
+    axes[1].set_title('Permutation Importance (Drop in ROC AUC)', fontsize=14)
+    axes[1].set_xlabel('Importance Score', fontsize=12)
+    axes[1].set_ylabel('')
+
+    fig.suptitle('Which Factor Decides the Race Winner?', fontsize=16)
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
     return fig
 
 def plot_3d_scatter(df):
@@ -156,3 +173,66 @@ def plot_rain_impact_swarm(df):
     ax.invert_yaxis()
     ax.grid(True, linestyle='--', alpha=0.5)
     return fig
+
+# --- Track-Specific Stats ---
+
+def compute_track_stats(track_data):
+    """
+    Calculates the key stats for a single Grand Prix and returns them as a dict.
+    """
+    avg_grid_winner = track_data[track_data['Winner'] == 1]['GridPosition'].mean()
+    total_races = track_data['year'].nunique()
+    pole_to_win_races = track_data[(track_data['GridPosition'] == 1) & (track_data['Winner'] == 1)]
+    pole_win_percentage = (len(pole_to_win_races) / total_races) * 100 if total_races > 0 else 0
+    return {
+        'total_races': total_races,
+        'avg_grid_winner': avg_grid_winner,
+        'pole_win_percentage': pole_win_percentage
+    }
+
+def plot_track_stats(track_data, track_name):
+    """
+    A stat panel for one Grand Prix (key numbers plus the winner's grid slot per year) and returns the figure object.
+    """
+    stats = compute_track_stats(track_data)
+    winners = track_data[track_data['Winner'] == 1].sort_values(by='year')
+
+    fig = plt.figure(figsize=(12, 6))
+    fig.suptitle(track_name, fontsize=18)
+
+    labels = [
+        ('Total Races Analyzed (2014+)', f"{stats['total_races']}"),
+        ("Average Winner's Start Position", f"{stats['avg_grid_winner']:.2f}"),
+        ('Pole to Win Conversion', f"{stats['pole_win_percentage']:.1f}%")
+    ]
+    for i, (label, value) in enumerate(labels):
+        ax = fig.add_axes([0.05 + i * 0.31, 0.72, 0.28, 0.15])
+        ax.axis('off')
+        ax.text(0.5, 0.7, value, ha='center', va='center', fontsize=22, fontweight='bold')
+        ax.text(0.5, 0.1, label, ha='center', va='center', fontsize=11)
+
+    ax = fig.add_axes([0.08, 0.1, 0.88, 0.55])
+    ax.bar(winners['year'].astype(str), winners['GridPosition'], color='gold', edgecolor='black')
+    ax.set_title("Winner's Starting Grid Position by Season", fontsize=14)
+    ax.set_xlabel('Season')
+    ax.set_ylabel('Grid Position')
+    ax.grid(True, axis='y', linestyle='--', alpha=0.5)
+    return fig
+
+# --- Show Everything (used by main.py) ---
+
+def show_all_visualizations(model_data_df, full_features_df, importance_df):
+    """
+    Displays all the overall analysis plots one by one.
+    """
+    plots = [
+        (plot_importance_comparison, importance_df),
+        (plot_grid_vs_performance_2d_scatter, model_data_df),
+        (plot_winner_profiles_violin, model_data_df),
+        (plot_3d_scatter, model_data_df),
+        (plot_grid_distribution, model_data_df),
+        (plot_rain_impact_swarm, model_data_df)
+    ]
+    for plot_func, data in plots:
+        plot_func(data)
+        plt.show()
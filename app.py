@@ -1,15 +1,16 @@
 import streamlit as st
 import pandas as pd
-from data_loader import load_all_data
+from data_loader import load_all_data, ANALYSIS_COLUMNS
 from feature_engineer import engineer_features
-from model_trainer import train_model
+from model_trainer import train_model, MODEL_MIN_YEAR
 from all_visuals import (
-    plot_feature_importance,
+    plot_importance_comparison,
     plot_3d_scatter,
     plot_grid_distribution,
     plot_winner_profiles_violin,
     plot_grid_vs_performance_2d_scatter,
-    plot_rain_impact_swarm
+    plot_rain_impact_swarm,
+    compute_track_stats
 )
 
 # --- Page Configuration ---
@@ -28,7 +29,7 @@ def load_and_prepare_data():
     Loads, merges, and engineers all features.
     This function will only run once and its result will be stored.
     """
-    master_df = load_all_data(data_path='data/')
+    master_df = load_all_data(data_path='data/', min_year=MODEL_MIN_YEAR, columns=ANALYSIS_COLUMNS)
     if master_df is None:
         return None, None, None
     
@@ -77,19 +78,16 @@ def main():
     # --- Key Stats Display ---
     if not track_data.empty:
         # Calculate stats for the selected track
-        avg_grid_winner = track_data[track_data['Winner'] == 1]['GridPosition'].mean()
-        total_races = track_data['year'].nunique()
-        pole_to_win_races = track_data[(track_data['GridPosition'] == 1) & (track_data['Winner'] == 1)]
-        pole_win_percentage = (len(pole_to_win_races) / total_races) * 100 if total_races > 0 else 0
+        stats = compute_track_stats(track_data)
         
         # Display stats in columns for a clean look
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric(label="Total Races Analyzed (2014+)", value=total_races)
+            st.metric(label="Total Races Analyzed (2014+)", value=stats['total_races'])
         with col2:
-            st.metric(label="Average Winner's Start Position", value=f"{avg_grid_winner:.2f}")
+            st.metric(label="Average Winner's Start Position", value=f"{stats['avg_grid_winner']:.2f}")
         with col3:
-            st.metric(label="Pole to Win Conversion", value=f"{pole_win_percentage:.1f}%")
+            st.metric(label="Pole to Win Conversion", value=f"{stats['pole_win_percentage']:.1f}%")
 
     else:
         st.warning("No data available for the selected track in the modern era (2014+).")
@@ -105,12 +103,16 @@ def main():
             
             # --- Feature Importance ---
             st.subheader("1. Which Factor is Most Important for Winning?")
-            fig = plot_feature_importance(importance_df)
+            fig = plot_importance_comparison(importance_df)
             st.pyplot(fig)
             st.markdown(
                 """
-                **Interpretation:** This chart shows the 'importance score' our machine learning model assigned to each factor. 
-                A higher score means the factor was more decisive in predicting a race winner. As we can see, **Grid Position** and **Team Performance** are overwhelmingly the most critical factors.
+                **Interpretation:** The left panel shows the Random Forest's built-in (impurity) scores: how often and how usefully the model splits on each factor. 
+                The right panel shows how much the model's ROC AUC drops when each factor is randomly shuffled, i.e. how much the predictions actually rely on it.
+                
+                Both panels agree that **Grid Position** is the most decisive factor, followed by **Position Change**. 
+                **Team Performance** gets a sizeable impurity score, but shuffling it barely changes the predictions: the information it carries (a fast car) is largely already reflected in where the driver starts. 
+                The simulated **Temperature** and **Rain Probability** matter little on either measure.
                 """
             )
             st.markdown("---")
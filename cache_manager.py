@@ -0,0 +1,242 @@
+import os
+import re
+import shutil
+import sqlite3
+import time
+import fastf1 as ff1
+import requests_cache
+
+# Side table inside the HTTP cache database that remembers when each response was last used
+ACCESS_TABLE = 'cache_access'
+
+# Name of FastF1's own requests_cache database inside its cache folder
+FASTF1_HTTP_CACHE_FILE = 'fastf1_http_cache.sqlite'
+
+# --- Stats ---
+
+def new_cache_stats():
+    """
+    Returns an empty hit/miss counter shared by the FastF1 and HTTP caches.
+    """
+    return {
+        'fastf1_hits': 0,
+        'fastf1_misses': 0,
+        'fastf1_bytes_saved': 0,
+        'http_hits': 0,
+        'http_misses': 0,
+        'http_bytes_saved': 0,
+        'bytes_evicted': 0
+    }
+
+def print_cache_stats(stats):
+    """
+    Prints hit rate and bytes saved for both caches.
+    """
+    print("\n--- Cache Stats ---")
+    for name in ['fastf1', 'http']:
+        hits, misses = stats[f'{name}_hits'], stats[f'{name}_misses']
+        total = hits + misses
+        hit_rate = (hits / total) * 100 if total > 0 else 0
+        print(f"{name}: {hits}/{total} hits ({hit_rate:.1f}%), {_format_bytes(stats[f'{name}_bytes_saved'])} not re-downloaded")
+    print(f"Evicted: {_format_bytes(stats['bytes_evicted'])}")
+
+# --- Helper Functions ---
+
+def _format_bytes(n_bytes):
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if n_bytes < 1024 or unit == 'GB':
+            return f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024
+
+def get_size(path):
+    """
+    Returns the size in bytes of a file, or of everything inside a folder.
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for f in files:
+            total += os.path.getsize(os.path.join(root, f))
+    return total
+
+def _last_used(path):
+    """
+    Newest modification time of a folder or anything inside it, sub-folders included
+    (record_fastf1_session marks a cache hit by touching the session folder).
+    """
+    latest = os.path.getmtime(path)
+    for root, dirs, files in os.walk(path):
+        for name in dirs + files:
+            latest = max(latest, os.path.getmtime(os.path.join(root, name)))
+    return latest
+
+def compact_sqlite(db_path):
+    """
+    Runs VACUUM so space from deleted rows is given back to the disk.
+    """
+    if not os.path.exists(db_path):
+        return 0
+    size_before = os.path.getsize(db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('VACUUM')
+    return size_before - os.path.getsize(db_path)
+
+# --- FastF1 Cache ---
+
+def setup_fastf1_cache(cache_path, offline=False):
+    """
+    Enables the FastF1 cache. In offline mode FastF1 only serves data that is already cached.
+    """
+    if not os.path.exists(cache_path):
+        os.makedirs(cache_path)
+    ff1.Cache.enable_cache(cache_path)
+    ff1.Cache.offline_mode(offline)
+    print(f"FastF1 Caching enabled at: {cache_path}" + (" (offline)" if offline else ""))
+
+def fastf1_session_dir(cache_path, session):
+    """
+    The folder FastF1 caches a session in, e.g. cache/2023/2023-03-05_Bahrain_Grand_Prix/2023-03-05_Race.
+    """
+    return os.path.join(cache_path, session.api_path.replace('/static/', '', 1).strip('/'))
+
+def record_fastf1_session(stats, session_dir, size_before):
+    """
+    Counts a session load as a hit if its data was already cached, and marks it as recently used.
+    """
+    if size_before > 0:
+        stats['fastf1_hits'] += 1
+        stats['fastf1_bytes_saved'] += size_before
+    else:
+        stats['fastf1_misses'] += 1
+    if os.path.isdir(session_dir):
+        os.utime(session_dir)
+
+def _fastf1_cache_units(cache_path, granularity):
+    """
+    Lists the evictable folders: one per season, or one per session.
+    """
+    seasons = [
+        os.path.join(cache_path, d) for d in os.listdir(cache_path)
+        if re.fullmatch(r'\d{4}', d) and os.path.isdir(os.path.join(cache_path, d))
+    ]
+    if granularity == 'season':
+        return seasons
+    sessions = []
+    for season in seasons:
+        for event in os.listdir(season):
+            event_path = os.path.join(season, event)
+            if os.path.isdir(event_path):
+                sessions += [os.path.join(event_path, s) for s in os.listdir(event_path) if os.path.isdir(os.path.join(event_path, s))]
+    return sessions
+
+def enforce_fastf1_cache_limit(cache_path, max_bytes, http_max_bytes, granularity='session', delete_expired=True, stats=None):
+    """
+    Deletes the least recently used seasons or sessions until the session folders fit in max_bytes.
+    FastF1's raw HTTP store (fastf1_http_cache.sqlite) is capped separately at http_max_bytes.
+    Keep delete_expired off in offline mode, where FastF1 still serves expired responses.
+    """
+    if not os.path.isdir(cache_path):
+        return 0
+    http_db_path = os.path.join(cache_path, FASTF1_HTTP_CACHE_FILE)
+    http_size = os.path.getsize(http_db_path) if os.path.exists(http_db_path) else 0
+    total = get_size(cache_path) - http_size
+    freed = 0
+    if total > max_bytes:
+        units = sorted(_fastf1_cache_units(cache_path, granularity), key=_last_used)
+        for unit in units:
+            if total - freed <= max_bytes:
+                break
+            unit_size = get_size(unit)
+            shutil.rmtree(unit)
+            freed += unit_size
+            print(f"Evicted from FastF1 cache: {unit} ({_format_bytes(unit_size)})")
+
+    # FastF1 keeps its raw HTTP responses in its own requests_cache SQLite file
+    if http_size > 0:
+        http_cache = requests_cache.SQLiteCache(http_db_path)
+        _evict_responses(http_cache, http_max_bytes, delete_expired=delete_expired)
+        http_cache.close()
+        freed += http_size - os.path.getsize(http_db_path)
+    if stats is not None:
+        stats['bytes_evicted'] += freed
+    return freed
+
+# --- HTTP (requests_cache) Cache ---
+
+def setup_http_cache(cache_name, offline=False, stats=None):
+    """
+    Creates a requests_cache session that never expires responses but records hits and last use.
+    In offline mode uncached requests fail (HTTP 504) instead of going to the network.
+    """
+    session = requests_cache.CachedSession(cache_name, expire_after=-1, only_if_cached=offline)
+    db_path = session.cache.responses.db_path
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(f'CREATE TABLE IF NOT EXISTS {ACCESS_TABLE} (key TEXT PRIMARY KEY, last_used REAL)')
+
+    def track_response(response, *args, **kwargs):
+        # On a miss the hook also fires for the raw response inside requests; only the
+        # response wrapped by requests_cache (which has 'from_cache') is counted
+        if not hasattr(response, 'from_cache'):
+            return response
+        # Offline misses come back as a synthetic 504 that is flagged as coming from the cache
+        from_cache = getattr(response, 'from_cache', False) and response.status_code != 504
+        if stats is not None:
+            if from_cache:
+                stats['http_hits'] += 1
+                stats['http_bytes_saved'] += len(response.content)
+            else:
+                stats['http_misses'] += 1
+        key = getattr(response, 'cache_key', None)
+        if key:
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(f'INSERT OR REPLACE INTO {ACCESS_TABLE} (key, last_used) VALUES (?, ?)', (key, time.time()))
+        return response
+
+    session.hooks['response'].append(track_response)
+    return session
+
+def _evict_responses(cache, max_bytes, delete_expired=True):
+    """
+    Deletes expired responses, then the least recently used ones until the stored bodies fit in max_bytes,
+    then compacts the file. Without an access table, the oldest inserted responses go first.
+    """
+    db_path = cache.responses.db_path
+    if delete_expired:
+        cache.delete(expired=True, vacuum=False)
+
+    with sqlite3.connect(db_path) as conn:
+        has_access = conn.execute('SELECT 1 FROM sqlite_master WHERE type = ? AND name = ?', ('table', ACCESS_TABLE)).fetchone()
+        if has_access:
+            query = (f'SELECT r.key, length(r.value) FROM responses r LEFT JOIN {ACCESS_TABLE} a ON r.key = a.key '
+                     'ORDER BY COALESCE(a.last_used, 0), r.rowid')
+        else:
+            query = 'SELECT key, length(value) FROM responses ORDER BY rowid'
+        rows = conn.execute(query).fetchall()
+        total = sum(size or 0 for _, size in rows)
+        to_delete = []
+        for key, size in rows:
+            if total <= max_bytes:
+                break
+            to_delete.append(key)
+            total -= size or 0
+        if to_delete and has_access:
+            conn.executemany(f'DELETE FROM {ACCESS_TABLE} WHERE key = ?', [(key,) for key in to_delete])
+
+    if to_delete:
+        cache.delete(*to_delete, vacuum=False)
+        print(f"Evicted {len(to_delete)} responses from HTTP cache: {db_path}")
+    compact_sqlite(db_path)
+
+def enforce_http_cache_limit(session, max_bytes, stats=None):
+    """
+    Deletes the least recently used responses until the stored bodies fit in max_bytes, then compacts the file.
+    """
+    db_path = session.cache.responses.db_path
+    size_before = os.path.getsize(db_path) if os.path.exists(db_path) else 0
+    _evict_responses(session.cache, max_bytes)
+
+    freed = size_before - os.path.getsize(db_path)
+    if stats is not None:
+        stats['bytes_evicted'] += max(freed, 0)
+    return freed
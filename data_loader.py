@@ -1,42 +1,154 @@
 import pandas as pd
+import numpy as np
 import os
+import shutil
 
-def load_all_data(data_path='data/'):
+# Columns the analysis pipeline (features, model, dashboard, report) actually uses
+ANALYSIS_COLUMNS = ['raceId', 'driverId', 'constructorId', 'year', 'date', 'raceName', 'grid', 'positionOrder', 'points']
+
+# Which output columns each table provides (after renaming), plus the keys it joins on
+RESULTS_KEYS = ['raceId', 'driverId', 'constructorId', 'statusId']
+STATUS_COLUMNS = ['status']
+RACE_COLUMNS = ['year', 'circuitId', 'date', 'raceName']
+CIRCUIT_COLUMNS = ['name', 'location', 'country']
+CONSTRUCTOR_COLUMNS = ['constructorName', 'nationality']
+QUALIFYING_COLUMNS = ['qualifyingPosition']
+
+# Large tables can be split into one file per season with partition_by_year()
+PARTITION_DIR = 'by_year'
+PARTITIONED_TABLES = ['results', 'qualifying']
+
+# Position of each row in the source CSV, stored in the partition files so the original order can be restored
+SOURCE_ROW = 'sourceRow'
+
+# --- Helper Functions ---
+
+def _wanted(columns, table_columns):
+    """
+    Returns the table columns that were asked for (all of them if columns is None).
+    """
+    if columns is None:
+        return list(table_columns)
+    return [col for col in table_columns if col in columns]
+
+def _partitions_are_current(partition_path, csv_path):
+    """
+    True if the partition files exist and none of them is older than the source CSV.
+    """
+    if not os.path.isdir(partition_path):
+        return False
+    files = [os.path.join(partition_path, f) for f in os.listdir(partition_path) if f.endswith('.csv')]
+    if not files:
+        return False
+    if min(os.path.getmtime(f) for f in files) < os.path.getmtime(csv_path):
+        print(f"Warning: '{partition_path}' is older than '{csv_path}'; reading the CSV instead. Re-run partition_by_year().")
+        return False
+    return True
+
+def _read_race_rows(data_path, table, usecols, race_ids, years):
+    """
+    Reads only the rows of a large table that belong to the selected races, in the same order as the CSV.
+    Uses the year-partitioned files when they are up to date, otherwise skips the other rows while parsing.
+    """
+    csv_path = os.path.join(data_path, f"{table}.csv")
+    partition_path = os.path.join(data_path, PARTITION_DIR, table)
+    if _partitions_are_current(partition_path, csv_path):
+        files = [os.path.join(partition_path, f"{year}.csv") for year in years]
+        frames = [pd.read_csv(f, usecols=usecols + [SOURCE_ROW]) for f in files if os.path.exists(f)]
+        if not frames:
+            return pd.read_csv(csv_path, usecols=usecols, nrows=0)
+        df = pd.concat(frames, ignore_index=True)
+        return df.sort_values(by=SOURCE_ROW).drop(columns=SOURCE_ROW).reset_index(drop=True)
+
+    if race_ids is None:
+        return pd.read_csv(csv_path, usecols=usecols)
+
+    # Only the raceId column is parsed up front; the parser then skips every non-matching line
+    row_race_ids = pd.read_csv(csv_path, usecols=['raceId'])['raceId']
+    skip_rows = np.flatnonzero(~row_race_ids.isin(race_ids).to_numpy()) + 1  # +1 for the header line
+    return pd.read_csv(csv_path, usecols=usecols, skiprows=set(skip_rows))
+
+# --- Main Loading Function ---
+
+def load_all_data(data_path='data/', min_year=None, max_year=None, columns=None):
     """
     Loads and merges all necessary F1 CSV files into a single DataFrame.
+    min_year / max_year and columns are applied while reading, so unused seasons and columns are never merged.
     """
     print("Loading datasets...")
     
     # Load all required CSVs
     try:
-        races = pd.read_csv(os.path.join(data_path, 'races.csv'))
-        results = pd.read_csv(os.path.join(data_path, 'results.csv'))
-        qualifying = pd.read_csv(os.path.join(data_path, 'qualifying.csv'))
-        constructors = pd.read_csv(os.path.join(data_path, 'constructors.csv'))
-        circuits = pd.read_csv(os.path.join(data_path, 'circuits.csv'))
-        status = pd.read_csv(os.path.join(data_path, 'status.csv'))
+        races = pd.read_csv(os.path.join(data_path, 'races.csv'), usecols=['raceId', 'year', 'circuitId', 'date', 'name'])
+        races = races[['raceId', 'year', 'circuitId', 'date', 'name']]
+        if min_year is not None:
+            races = races[races['year'] >= min_year]
+        if max_year is not None:
+            races = races[races['year'] <= max_year]
+        filtered = min_year is not None or max_year is not None
+        race_ids = races['raceId'] if filtered else None
+        years = sorted(races['year'].unique())
+
+        results_header = pd.read_csv(os.path.join(data_path, 'results.csv'), nrows=0).columns
+        results_cols = RESULTS_KEYS + [col for col in _wanted(columns, results_header) if col not in RESULTS_KEYS]
+        results = _read_race_rows(data_path, 'results', results_cols, race_ids, years)
+
+        if _wanted(columns, QUALIFYING_COLUMNS):
+            qualifying = _read_race_rows(data_path, 'qualifying', ['raceId', 'driverId', 'position'], race_ids, years)
+        if _wanted(columns, CONSTRUCTOR_COLUMNS):
+            constructors = pd.read_csv(os.path.join(data_path, 'constructors.csv'), usecols=['constructorId', 'name', 'nationality'])
+        if _wanted(columns, CIRCUIT_COLUMNS):
+            circuits = pd.read_csv(os.path.join(data_path, 'circuits.csv'), usecols=['circuitId', 'name', 'location', 'country'])
+        if _wanted(columns, STATUS_COLUMNS):
+            status = pd.read_csv(os.path.join(data_path, 'status.csv'))
     except FileNotFoundError as e:
         print(f"Error: {e}")
         print("Please make sure all CSV files (races, results, qualifying, constructors, circuits, status) are in the 'data/' folder.")
         return None
 
     # --- Merging ---
+    df = results
     
     # 1. Merge results with status
-    df = pd.merge(results, status, on='statusId', how='left')
+    if _wanted(columns, STATUS_COLUMNS):
+        df = pd.merge(df, status, on='statusId', how='left')
     
     # 2. Merge with races 
-    df = pd.merge(df, races[['raceId', 'year', 'circuitId', 'date', 'name']].rename(columns={'name': 'raceName'}), on='raceId', how='left')
+    df = pd.merge(df, races.rename(columns={'name': 'raceName'}), on='raceId', how='left')
     
     # 3. Merge with circuits
-    df = pd.merge(df, circuits[['circuitId', 'name', 'location', 'country']], on='circuitId', how='left')
+    if _wanted(columns, CIRCUIT_COLUMNS):
+        df = pd.merge(df, circuits, on='circuitId', how='left')
     
     # 4. Merge with constructors
-    df = pd.merge(df, constructors[['constructorId', 'name', 'nationality']].rename(columns={'name': 'constructorName'}), on='constructorId', how='left')
+    if _wanted(columns, CONSTRUCTOR_COLUMNS):
+        df = pd.merge(df, constructors.rename(columns={'name': 'constructorName'}), on='constructorId', how='left')
     
     # 5. Merge with qualifying
-    q_simple = qualifying[['raceId', 'driverId', 'position']].rename(columns={'position': 'qualifyingPosition'})
-    df = pd.merge(df, q_simple, on=['raceId', 'driverId'], how='left')
+    if _wanted(columns, QUALIFYING_COLUMNS):
+        q_simple = qualifying.rename(columns={'position': 'qualifyingPosition'})
+        df = pd.merge(df, q_simple, on=['raceId', 'driverId'], how='left')
+
+    if columns is not None:
+        df = df[[col for col in df.columns if col in columns]]
 
     print("Data loading and merging complete.")
-    return df
\ No newline at end of file
+    return df
+
+def partition_by_year(data_path='data/', tables=PARTITIONED_TABLES):
+    """
+    Splits the large per-race tables into one CSV per season under data/by_year/<table>/<year>.csv.
+    load_all_data() then only opens the files for the seasons it needs.
+    """
+    races = pd.read_csv(os.path.join(data_path, 'races.csv'), usecols=['raceId', 'year'])
+    for table in tables:
+        df = pd.read_csv(os.path.join(data_path, f"{table}.csv"))
+        df[SOURCE_ROW] = np.arange(len(df))
+        out_dir = os.path.join(data_path, PARTITION_DIR, table)
+        # Start from scratch so seasons that no longer exist don't leave stale files behind
+        shutil.rmtree(out_dir, ignore_errors=True)
+        os.makedirs(out_dir)
+        df = pd.merge(df, races, on='raceId', how='left')
+        for year, year_df in df.groupby('year'):
+            year_df.drop(columns='year').to_csv(os.path.join(out_dir, f"{int(year)}.csv"), index=False)
+        print(f"Partitioned '{table}' into {df['year'].nunique()} season files in: {out_dir}")
@@ -28,12 +28,18 @@ def engineer_features(df):
     df['RainProbability'] = np.random.choice([0, 0.1, 0.5, 0.9], len(df), p=[0.7, 0.15, 0.1, 0.05])
 
     # --- Feature 5: TeamPerformanceScore (Engineered) ---
-    team_points = df.groupby(['raceId', 'constructorId'])['points'].sum().reset_index()
-    df = pd.merge(df, team_points.rename(columns={'points': 'teamPointsInRace'}), on=['raceId', 'constructorId'], how='left')
-    
-    df = df.sort_values(by='date')
-    
-    df['TeamPerformanceScore'] = df.groupby(['year', 'constructorId'])['teamPointsInRace'].shift(1).rolling(window=5, min_periods=1).mean()
+    # One row per team per race, so the lag never picks up the teammate's result from the same race
+    team_points = df.groupby(['year', 'constructorId', 'raceId', 'date'], as_index=False)['points'].sum()
+    team_points = team_points.rename(columns={'points': 'teamPointsInRace'})
+    team_points = team_points.sort_values(by=['date', 'raceId'], kind='stable')
+    
+    # Average of the team's previous (up to 5) races in the same season
+    team_points['TeamPerformanceScore'] = team_points.groupby(['year', 'constructorId'])['teamPointsInRace'].transform(
+        lambda points: points.shift(1).rolling(window=5, min_periods=1).mean()
+    )
+    df = pd.merge(df, team_points[['raceId', 'constructorId', 'teamPointsInRace', 'TeamPerformanceScore']], on=['raceId', 'constructorId'], how='left')
+    
+    df = df.sort_values(by=['date', 'raceId', 'driverId'], kind='stable')
     
     # --- Clean Up Data ---
     df['TeamPerformanceScore'] = df['TeamPerformanceScore'].fillna(0)
@@ -1,28 +1,40 @@
 import pandas as pd
 import fastf1 as ff1
 import openmeteo_requests
-import requests_cache
 from retry_requests import retry
 import os
+from cache_manager import (
+    new_cache_stats,
+    print_cache_stats,
+    setup_fastf1_cache,
+    setup_http_cache,
+    fastf1_session_dir,
+    get_size,
+    record_fastf1_session,
+    enforce_fastf1_cache_limit,
+    enforce_http_cache_limit
+)
 
 # --- Setup: Caching is ESSENTIAL for APIs ---
 
-# 1. Setup FastF1 Caching (so you don't re-download GBs of data)
+# 1. FastF1 Cache (so you don't re-download GBs of data)
 # This will create a 'cache' folder in your project
 cache_path = 'cache'
-if not os.path.exists(cache_path):
-    os.makedirs(cache_path)
-ff1.Cache.enable_cache(cache_path)
-print(f"FastF1 Caching enabled at: {cache_path}")
 
-# 2. Setup Open-Meteo Caching
-cache_session = requests_cache.CachedSession('.cache', expire_after=-1)
-retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
-openmeteo = openmeteo_requests.Client(session=retry_session)
+# 2. Open-Meteo Cache (SQLite file '.cache.sqlite')
+http_cache_name = '.cache'
+
+# Size caps and offline mode can be set from the environment (e.g. in Docker)
+FASTF1_CACHE_MAX_MB = int(os.environ.get('F1_FASTF1_CACHE_MAX_MB', 2048))
+FASTF1_HTTP_CACHE_MAX_MB = int(os.environ.get('F1_FASTF1_HTTP_CACHE_MAX_MB', 256))
+HTTP_CACHE_MAX_MB = int(os.environ.get('F1_HTTP_CACHE_MAX_MB', 50))
+CACHE_EVICTION = os.environ.get('F1_CACHE_EVICTION', 'session')  # 'session' or 'season'
+CACHE_ENFORCE_EVERY = int(os.environ.get('F1_CACHE_ENFORCE_EVERY', 25))  # FastF1 cap is also applied every N sessions
+OFFLINE = os.environ.get('F1_CACHE_OFFLINE', '0') == '1'
 
 # --- Helper Function for Weather API ---
 
-def fetch_weather(lat, lng, date_str):
+def fetch_weather(openmeteo, lat, lng, date_str):
     """
     Fetches historical weather for a specific lat/lng/date from Open-Meteo.
     """
@@ -47,9 +59,25 @@ def fetch_weather(lat, lng, date_str):
         print(f"Weather API Error for {date_str}: {e}")
         return {'Temperature': None, 'RainProbability': None}
 
+# --- Helper Function for the Cache Limits ---
+
+def enforce_fastf1_limit(offline, stats):
+    """
+    Applies the FastF1 size caps (session folders and FastF1's raw HTTP store).
+    """
+    enforce_fastf1_cache_limit(cache_path, FASTF1_CACHE_MAX_MB * 1024 * 1024, FASTF1_HTTP_CACHE_MAX_MB * 1024 * 1024,
+                               granularity=CACHE_EVICTION, delete_expired=not offline, stats=stats)
+
+
 # --- Main Data Generation Function ---
 
-def generate_data():
+def generate_data(offline=OFFLINE):
+    stats = new_cache_stats()
+    setup_fastf1_cache(cache_path, offline=offline)
+    cache_session = setup_http_cache(http_cache_name, offline=offline, stats=stats)
+    retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
+    openmeteo = openmeteo_requests.Client(session=retry_session)
+
     print("Loading base data files...")
     # Load the "keys" we need to call the APIs
     races = pd.read_csv('data/races.csv')
@@ -67,63 +95,77 @@ def generate_data():
 
     print(f"Starting to process {len(races_to_process)} races. This will take a long time...")
 
-    for index, race in races_to_process.iterrows():
-        print(f"Processing: {race['year']} {race['name_x']}...")
+    sessions_loaded = 0
+    try:
+        for index, race in races_to_process.iterrows():
+            print(f"Processing: {race['year']} {race['name_x']}...")
         
-        # --- 1. Get Weather Data ---
-        weather_info = fetch_weather(race['lat'], race['lng'], race['date'])
-        weather_info['raceId'] = race['raceId']
-        all_weather_data.append(weather_info)
+            # --- 1. Get Weather Data ---
+            weather_info = fetch_weather(openmeteo, race['lat'], race['lng'], race['date'])
+            weather_info['raceId'] = race['raceId']
+            all_weather_data.append(weather_info)
         
-        # --- 2. Get FastF1 Pace Data ---
-        try:
-            # Load the race session
-            session = ff1.get_session(race['year'], race['round'], 'R') # 'R' is for Race
-            session.load(laps=True, telemetry=False, weather=False) # We don't need telemetry here
-
-            # Get all laps for all drivers
-            laps = session.laps
+            # --- 2. Get FastF1 Pace Data ---
+            try:
+                # Load the race session
+                session = ff1.get_session(race['year'], race['round'], 'R') # 'R' is for Race
+                session_dir = fastf1_session_dir(cache_path, session)
+                size_before = get_size(session_dir) if os.path.isdir(session_dir) else 0
+                session.load(laps=True, telemetry=False, weather=False) # We don't need telemetry here
+                record_fastf1_session(stats, session_dir, size_before)
+                sessions_loaded += 1
+                if sessions_loaded % CACHE_ENFORCE_EVERY == 0:
+                    enforce_fastf1_limit(offline, stats)
+
+                # Get all laps for all drivers
+                laps = session.laps
             
-            for driver_abbr in laps['Driver'].unique():
-                # Map driver abbreviation (e.g., 'VER') to the driverId (e.g., 830)
-                driver_row = drivers[drivers['code'] == driver_abbr]
-                if driver_row.empty:
-                    continue # Skip if driver (e.g., guest) isn't in our file
+                for driver_abbr in laps['Driver'].unique():
+                    # Map driver abbreviation (e.g., 'VER') to the driverId (e.g., 830)
+                    driver_row = drivers[drivers['code'] == driver_abbr]
+                    if driver_row.empty:
+                        continue # Skip if driver (e.g., guest) isn't in our file
                 
-                driver_id = driver_row.iloc[0]['driverId']
+                    driver_id = driver_row.iloc[0]['driverId']
                 
-                # Use pick_quick() to filter out slow/pit/formation laps. This is a powerful feature!
-                driver_laps = laps.pick_driver(driver_abbr).pick_quick()
+                    # Use pick_quick() to filter out slow/pit/formation laps. This is a powerful feature!
+                    driver_laps = laps.pick_driver(driver_abbr).pick_quick()
                 
-                if not driver_laps.empty:
-                    # Calculate median pace from all "clean" laps
-                    median_pace = driver_laps['LapTime'].median()
+                    if not driver_laps.empty:
+                        # Calculate median pace from all "clean" laps
+                        median_pace = driver_laps['LapTime'].median()
                     
-                    all_pace_data.append({
-                        'raceId': race['raceId'],
-                        'driverId': driver_id,
-                        'MedianRacePace': median_pace
-                    })
+                        all_pace_data.append({
+                            'raceId': race['raceId'],
+                            'driverId': driver_id,
+                            'MedianRacePace': median_pace
+                        })
 
-        except Exception as e:
-            print(f"  -> Error processing FastF1 data for {race['year']} {race['name_x']}: {e}")
+            except Exception as e:
+                print(f"  -> Error processing FastF1 data for {race['year']} {race['name_x']}: {e}")
 
-    # --- 3. Save the new data to CSVs ---
-    print("Processing complete. Saving new data files...")
+        # --- 3. Save the new data to CSVs ---
+        print("Processing complete. Saving new data files...")
     
-    weather_df = pd.DataFrame(all_weather_data)
-    weather_df.to_csv('data/generated_weather.csv', index=False)
-    print("Saved 'data/generated_weather.csv'")
+        weather_df = pd.DataFrame(all_weather_data)
+        weather_df.to_csv('data/generated_weather.csv', index=False)
+        print("Saved 'data/generated_weather.csv'")
     
-  if all_pace_data:
-        pace_df = pd.DataFrame(all_pace_data)
-        pace_df.to_csv('data/generated_pace.csv', index=False)
-        print(f"Saved {len(pace_df)} rows to 'data/generated_pace.csv'")
-    else:
-        print("Warning: No pace data was generated.")
-        # Create a file with just headers so it's not "empty"
-        pd.DataFrame(columns=['raceId', 'driverId', 'MedianRacePace']).to_csv('data/generated_pace.csv', index=False)
-        print("Created 'data/generated_pace.csv' with headers (no data found).")
+        if all_pace_data:
+            pace_df = pd.DataFrame(all_pace_data)
+            pace_df.to_csv('data/generated_pace.csv', index=False)
+            print(f"Saved {len(pace_df)} rows to 'data/generated_pace.csv'")
+        else:
+            print("Warning: No pace data was generated.")
+            # Create a file with just headers so it's not "empty"
+            pd.DataFrame(columns=['raceId', 'driverId', 'MedianRacePace']).to_csv('data/generated_pace.csv', index=False)
+            print("Created 'data/generated_pace.csv' with headers (no data found).")
+    finally:
+        # --- 4. Keep the caches within their size limits ---
+        # Runs even if the loop is interrupted (Ctrl+C, or FastF1 exiting on an API error)
+        enforce_fastf1_limit(offline, stats)
+        enforce_http_cache_limit(cache_session, HTTP_CACHE_MAX_MB * 1024 * 1024, stats=stats)
+        print_cache_stats(stats)
 
 if __name__ == "__main__":
-    generate_data()
\ No newline at end of file
+    generate_data()
@@ -0,0 +1,102 @@
+import pandas as pd
+import numpy as np
+import os
+
+# Key used for the career (all seasons combined) matrices
+ALL_SEASONS = 'All Seasons'
+
+# Columns load_all_data() needs to provide for the head-to-head matrices
+HEAD_TO_HEAD_COLUMNS = ['raceId', 'driverId', 'constructorId', 'year', 'positionOrder', 'points', 'qualifyingPosition', 'constructorName']
+
+STAT_COLUMNS = ['races', 'finish_ahead', 'quali_ahead', 'points_delta']
+
+# --- Helper Functions ---
+
+def _per_race_entries(df, id_col):
+    """
+    One row per (race, driver) or (race, constructor).
+    A constructor is represented by its best finisher, best qualifier and total points.
+    """
+    entries = df[['year', 'raceId', id_col, 'positionOrder', 'qualifyingPosition', 'points']].copy()
+    entries['qualifyingPosition'] = pd.to_numeric(entries['qualifyingPosition'], errors='coerce')
+    return entries.groupby(['year', 'raceId', id_col], as_index=False).agg(
+        positionOrder=('positionOrder', 'min'),
+        qualifyingPosition=('qualifyingPosition', 'min'),
+        points=('points', 'sum')
+    )
+
+def _pairwise_totals(entries, id_col):
+    """
+    Joins every entry with every rival in the same race and sums the pair stats per season.
+    """
+    pairs = pd.merge(entries, entries, on=['year', 'raceId'], suffixes=('_a', '_b'))
+    pairs = pairs[pairs[f'{id_col}_a'] != pairs[f'{id_col}_b']]
+
+    pairs['races'] = 1
+    pairs['finish_ahead'] = (pairs['positionOrder_a'] < pairs['positionOrder_b']).astype(int)
+    pairs['quali_ahead'] = (pairs['qualifyingPosition_a'] < pairs['qualifyingPosition_b']).astype(int)  # NaN compares False
+    pairs['points_delta'] = pairs['points_a'] - pairs['points_b']
+
+    return pairs.groupby(['year', f'{id_col}_a', f'{id_col}_b'], as_index=False)[STAT_COLUMNS].sum()
+
+def _to_matrices(totals, id_col):
+    """
+    Packs the pair totals into square arrays plus an id -> row/column lookup.
+    """
+    ids = np.union1d(totals[f'{id_col}_a'], totals[f'{id_col}_b'])
+    rows = np.searchsorted(ids, totals[f'{id_col}_a'])
+    cols = np.searchsorted(ids, totals[f'{id_col}_b'])
+
+    matrices = {'ids': ids, 'index': {entity_id: i for i, entity_id in enumerate(ids.tolist())}}
+    for stat in STAT_COLUMNS:
+        dtype = np.float32 if stat == 'points_delta' else np.int16
+        matrix = np.zeros((len(ids), len(ids)), dtype=dtype)
+        matrix[rows, cols] = totals[stat].to_numpy()
+        matrices[stat] = matrix
+    return matrices
+
+# --- Main Functions ---
+
+def build_head_to_head(df, id_col):
+    """
+    Precomputes head-to-head matrices for every season (plus all seasons combined).
+    id_col is 'driverId' or 'constructorId'.
+    """
+    print(f"Building head-to-head matrices for '{id_col}'...")
+    totals = _pairwise_totals(_per_race_entries(df, id_col), id_col)
+
+    store = {}
+    for year, year_totals in totals.groupby('year'):
+        store[int(year)] = _to_matrices(year_totals, id_col)
+
+    career_totals = totals.groupby([f'{id_col}_a', f'{id_col}_b'], as_index=False)[STAT_COLUMNS].sum()
+    store[ALL_SEASONS] = _to_matrices(career_totals, id_col)
+
+    print(f"Head-to-head matrices built for {len(store) - 1} seasons.")
+    return store
+
+def lookup_head_to_head(store, season, id_a, id_b):
+    """
+    Returns the head-to-head stats of A against B, or None if they never raced each other.
+    """
+    matrices = store.get(season)
+    if matrices is None or id_a not in matrices['index'] or id_b not in matrices['index']:
+        return None
+    i, j = matrices['index'][id_a], matrices['index'][id_b]
+    if matrices['races'][i, j] == 0:
+        return None
+    return {
+        'races': int(matrices['races'][i, j]),
+        'finish_ahead_a': int(matrices['finish_ahead'][i, j]),
+        'finish_ahead_b': int(matrices['finish_ahead'][j, i]),
+        'quali_ahead_a': int(matrices['quali_ahead'][i, j]),
+        'quali_ahead_b': int(matrices['quali_ahead'][j, i]),
+        'points_delta': float(matrices['points_delta'][i, j])
+    }
+
+def load_driver_names(data_path='data/'):
+    """
+    Maps driverId to 'Forename Surname'.
+    """
+    drivers = pd.read_csv(os.path.join(data_path, 'drivers.csv'), usecols=['driverId', 'forename', 'surname'])
+    return dict(zip(drivers['driverId'], drivers['forename'] + ' ' + drivers['surname']))
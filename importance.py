@@ -0,0 +1,122 @@
+import hashlib
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.metrics import roc_auc_score
+
+# Results are cached here so the dashboard only pays for the computation once
+IMPORTANCE_CACHE_DIR = os.path.join('.cache', 'importance')
+
+# --- Helper Functions ---
+
+def _batched_predict_proba(model, X, batch_size):
+    """
+    Predicts winner probabilities in fixed-size batches to keep memory flat.
+    """
+    if len(X) <= batch_size:
+        return model.predict_proba(X)[:, 1]
+    batches = [model.predict_proba(X[start:start + batch_size])[:, 1] for start in range(0, len(X), batch_size)]
+    return np.concatenate(batches)
+
+def _score(model, X, y, batch_size):
+    """
+    Scores the model with ROC AUC, which stays meaningful for the rare 'Winner' class.
+    """
+    return roc_auc_score(y, _batched_predict_proba(model, X, batch_size))
+
+def _strata_for(X, conditional_on, n_bins):
+    """
+    Buckets rows by quantiles of the conditioning feature (None means one bucket).
+    """
+    if conditional_on is None:
+        return np.zeros(len(X), dtype=int)
+    bins = pd.qcut(X[conditional_on], q=n_bins, labels=False, duplicates='drop')
+    return bins.to_numpy()
+
+def _permuted_scores(model, X, y, columns, strata, n_repeats, seed, batch_size):
+    """
+    Scores the model n_repeats times with the given columns shuffled together.
+    Rows are only shuffled within their stratum, which gives conditional importance.
+    """
+    rng = np.random.RandomState(seed)
+    col_idx = [X.columns.get_loc(col) for col in columns]
+    X_values = X.to_numpy(copy=True)
+    original = X_values[:, col_idx].copy()
+    stratum_rows = [np.flatnonzero(strata == s) for s in np.unique(strata)]
+
+    scores = []
+    for _ in range(n_repeats):
+        order = np.arange(len(X_values))
+        for rows in stratum_rows:
+            order[rows] = rng.permutation(rows)
+        X_values[:, col_idx] = original[order]
+        scores.append(_score(model, X_values, y, batch_size))
+    return scores
+
+def _cache_key(model, X, y, params):
+    """
+    Builds a cache key from the pickled model artifact, the dataset and the settings.
+    """
+    digest = hashlib.sha256()
+    digest.update(pickle.dumps(model))
+    digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(pd.Series(y), index=False).to_numpy().tobytes())
+    digest.update(repr(sorted(params.items())).encode())
+    return digest.hexdigest()
+
+# --- Main Importance Function ---
+
+def compute_permutation_importance(model, X, y, groups=None, conditional_on=None, n_bins=5,
+                                   n_repeats=10, n_jobs=-1, batch_size=4096, random_state=42,
+                                   cache_dir=IMPORTANCE_CACHE_DIR):
+    """
+    Computes permutation importance for each feature (or group of features) in parallel.
+
+    groups maps a display name to a list of columns that are permuted together.
+    conditional_on names a column whose quantile bins restrict the shuffling.
+    Results are cached on disk, keyed by model, dataset and settings.
+    """
+    X = pd.DataFrame(X)
+    y = np.asarray(y)
+    if groups is None:
+        groups = {col: [col] for col in X.columns}
+
+    params = {
+        'groups': sorted((name, tuple(cols)) for name, cols in groups.items()),
+        'conditional_on': conditional_on,
+        'n_bins': n_bins,
+        'n_repeats': n_repeats,
+        'random_state': random_state,
+    }
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = os.path.join(cache_dir, f"{_cache_key(model, X, y, params)}.csv")
+        if os.path.exists(cache_file):
+            print(f"Loaded cached permutation importances from: {cache_file}")
+            return pd.read_csv(cache_file)
+
+    print(f"Computing permutation importance for {len(groups)} features ({n_repeats} repeats each)...")
+    baseline = _score(model, X.to_numpy(), y, batch_size)
+    strata = _strata_for(X, conditional_on, n_bins)
+
+    names = list(groups)
+    all_scores = Parallel(n_jobs=n_jobs)(
+        delayed(_permuted_scores)(model, X, y, groups[name], strata, n_repeats, random_state + i, batch_size)
+        for i, name in enumerate(names)
+    )
+
+    drops = baseline - np.array(all_scores)
+    result_df = pd.DataFrame({
+        'feature': names,
+        'permutation_importance': drops.mean(axis=1),
+        'permutation_std': drops.std(axis=1)
+    }).sort_values(by='permutation_importance', ascending=False).reset_index(drop=True)
+
+    if cache_file is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        result_df.to_csv(cache_file, index=False)
+        print(f"Saved permutation importances to: {cache_file}")
+
+    return result_df
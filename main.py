@@ -1,11 +1,11 @@
-from data_loader import load_all_data
+from data_loader import load_all_data, ANALYSIS_COLUMNS
 from feature_engineer import engineer_features
-from model_trainer import train_model
+from model_trainer import train_model, MODEL_MIN_YEAR
 from all_visuals import show_all_visualizations
 
 def main():
-    # Step 1: Load and merge all CSVs
-    master_df = load_all_data(data_path='data/')
+    # Step 1: Load and merge the CSVs (only the seasons and columns the analysis uses)
+    master_df = load_all_data(data_path='data/', min_year=MODEL_MIN_YEAR, columns=ANALYSIS_COLUMNS)
     
     if master_df is None:
         return
@@ -3,6 +3,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report
+from importance import compute_permutation_importance
 
 # These are the original features BEFORE API data
 MODEL_FEATURES = [
@@ -16,6 +17,9 @@ MODEL_FEATURES = [
 # This is the target we want to predict
 MODEL_TARGET = 'Winner'
 
+# The model only looks at the modern (hybrid) era
+MODEL_MIN_YEAR = 2014
+
 def train_model(df):
     """
     Trains a RandomForest model to find feature importances.
@@ -23,7 +27,7 @@ def train_model(df):
     print("Training model...")
     
     # 1. Select data from a modern era
-    df_model = df[df['year'] >= 2014].copy()
+    df_model = df[df['year'] >= MODEL_MIN_YEAR].copy()
     
     # 2. Define Features (X) and Target (y)
     X = df_model[MODEL_FEATURES]
@@ -51,7 +55,13 @@ def train_model(df):
     feature_importance_df = pd.DataFrame({
         'feature': MODEL_FEATURES,
         'importance': importances
-    }).sort_values(by='importance', ascending=False)
+    })
+    
+    # 8. Get Permutation Importances (impurity scores favour continuous features like Temperature)
+    X_test_scaled_df = pd.DataFrame(X_test_scaled, columns=MODEL_FEATURES)
+    permutation_df = compute_permutation_importance(model, X_test_scaled_df, y_test)
+    feature_importance_df = pd.merge(feature_importance_df, permutation_df, on='feature', how='left')
+    feature_importance_df = feature_importance_df.sort_values(by='importance', ascending=False)
     
     print("Model training complete.")
     
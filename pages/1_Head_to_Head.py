@@ -0,0 +1,86 @@
+import streamlit as st
+from data_loader import load_all_data
+from head_to_head import (
+    ALL_SEASONS,
+    HEAD_TO_HEAD_COLUMNS,
+    build_head_to_head,
+    lookup_head_to_head,
+    load_driver_names
+)
+
+# --- Page Configuration ---
+st.set_page_config(
+    page_title="F1 Head-to-Head",
+    page_icon="🏎️",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# --- Caching ---
+# The matrices are built once per server and shared by every session without copying.
+@st.cache_resource
+def load_head_to_head():
+    """
+    Loads results and qualifying and precomputes all driver and constructor matchups.
+    """
+    df = load_all_data(data_path='data/', columns=HEAD_TO_HEAD_COLUMNS)
+    if df is None:
+        return None
+
+    constructor_names = dict(zip(df['constructorId'], df['constructorName']))
+    return {
+        'Drivers': (build_head_to_head(df, 'driverId'), load_driver_names(data_path='data/')),
+        'Constructors': (build_head_to_head(df, 'constructorId'), constructor_names)
+    }
+
+# --- Main Application ---
+def main():
+    st.title("🆚 Head-to-Head Comparison")
+    st.markdown("Compare two drivers or two teams across every race they both started.")
+
+    with st.spinner('Building head-to-head tables... Please wait.'):
+        stores = load_head_to_head()
+
+    if stores is None:
+        st.error("Failed to load data. Please check your data files.")
+        return
+
+    # --- Selectors ---
+    kind = st.radio('Compare:', ['Drivers', 'Constructors'], horizontal=True)
+    store, names = stores[kind]
+
+    seasons = [ALL_SEASONS] + sorted((s for s in store if s != ALL_SEASONS), reverse=True)
+    season = st.selectbox('Season:', seasons, index=1) # Latest season by default
+
+    # Only offer entrants from the selected season, sorted by name
+    ids = sorted(store[season]['ids'].tolist(), key=lambda entity_id: names.get(entity_id, str(entity_id)))
+    col1, col2 = st.columns(2)
+    with col1:
+        id_a = st.selectbox('First:', ids, format_func=lambda entity_id: names.get(entity_id, str(entity_id)))
+    with col2:
+        id_b = st.selectbox('Second:', ids, index=min(1, len(ids) - 1), format_func=lambda entity_id: names.get(entity_id, str(entity_id)))
+
+    name_a, name_b = names.get(id_a, str(id_a)), names.get(id_b, str(id_b))
+    stats = lookup_head_to_head(store, season, id_a, id_b) if id_a != id_b else None
+
+    st.markdown("---")
+
+    # --- Key Stats Display ---
+    if stats is None:
+        st.warning(f"{name_a} and {name_b} never started the same race in this selection.")
+        return
+
+    st.subheader(f"{name_a} vs. {name_b}")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(label="Shared Races", value=stats['races'])
+    with col2:
+        st.metric(label="Finished Ahead", value=f"{stats['finish_ahead_a']} - {stats['finish_ahead_b']}")
+    with col3:
+        st.metric(label="Qualified Ahead", value=f"{stats['quali_ahead_a']} - {stats['quali_ahead_b']}")
+    with col4:
+        st.metric(label=f"Points Difference ({name_a})", value=f"{stats['points_delta']:+.1f}")
+
+    st.caption("Constructors are compared by their best-placed car; qualifying data is only available from 1994 onwards.")
+
+main()
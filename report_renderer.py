@@ -0,0 +1,183 @@
+import matplotlib
+matplotlib.use('Agg')  # Headless: never open a window, also inside the worker processes
+
+import hashlib
+import html
+import inspect
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib.pyplot as plt
+import pandas as pd
+from data_loader import load_all_data, ANALYSIS_COLUMNS
+from feature_engineer import engineer_features
+from model_trainer import train_model, MODEL_MIN_YEAR
+from all_visuals import (
+    plot_importance_comparison,
+    plot_3d_scatter,
+    plot_grid_distribution,
+    plot_winner_profiles_violin,
+    plot_grid_vs_performance_2d_scatter,
+    plot_rain_impact_swarm,
+    compute_track_stats,
+    plot_track_stats
+)
+
+REPORT_DIR = 'report'
+MANIFEST_FILE = 'manifest.json'
+
+# Bump to force every figure to be redrawn (e.g. after changing the output format)
+RENDER_VERSION = 1
+
+# Every overall figure: (file name, title, plot function, which input it needs)
+OVERALL_FIGURES = [
+    ('feature_importance', 'Which Factor is Most Important for Winning?', plot_importance_comparison, 'importance'),
+    ('grid_vs_performance', "The 'Winning Zone': Grid Position vs. Team Performance", plot_grid_vs_performance_2d_scatter, 'model'),
+    ('winner_profiles', 'How Winners Differ from the Rest of the Field', plot_winner_profiles_violin, 'model'),
+    ('3d_scatter', '3D Analysis of Key Factors', plot_3d_scatter, 'model'),
+    ('grid_distribution', 'Starting Grid Position: Winners vs. Non-Winners', plot_grid_distribution, 'model'),
+    ('rain_impact', 'Race Results in Wet vs. Dry Conditions', plot_rain_impact_swarm, 'model')
+]
+
+# --- Helper Functions ---
+
+def _slugify(name):
+    """
+    Turns a race name like 'Italian Grand Prix' into 'italian-grand-prix'.
+    """
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+def _hash_inputs(name, df, funcs):
+    """
+    Fingerprints the data and the code behind one output (every function in funcs that draws
+    or computes part of it) so unchanged outputs can be skipped.
+    """
+    digest = hashlib.sha256(f"{RENDER_VERSION}:{name}".encode())
+    for func in funcs:
+        digest.update(inspect.getsource(func).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _render_figure(plot_func, args, out_path):
+    """
+    Runs in a worker process: draws one figure and saves it as a PNG.
+    """
+    fig = plot_func(*args)
+    fig.savefig(out_path, dpi=100, bbox_inches='tight')
+    plt.close(fig)
+    return out_path
+
+def _load_manifest(report_dir):
+    manifest_path = os.path.join(report_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path) as f:
+        return json.load(f)
+
+def _save_manifest(report_dir, manifest):
+    with open(os.path.join(report_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+def _remove_orphans(report_dir, manifest, current_paths):
+    """
+    Deletes figures (and their manifest entries) that the current data no longer produces,
+    e.g. a Grand Prix that dropped out of the selection.
+    """
+    on_disk = {
+        f'{folder}/{f}' for folder in ['overall', 'tracks']
+        for f in os.listdir(os.path.join(report_dir, folder)) if f.endswith('.png')
+    }
+    for rel_path in (on_disk | set(manifest)) - current_paths:
+        path = os.path.join(report_dir, rel_path)
+        if os.path.exists(path):
+            os.remove(path)
+        manifest.pop(rel_path, None)
+        print(f"Removed outdated report figure: {rel_path}")
+
+def _write_index(report_dir, track_rows):
+    """
+    Writes a static index.html that links every rendered figure.
+    """
+    parts = [
+        '<!DOCTYPE html>',
+        '<html><head><meta charset="utf-8"><title>F1 Race Winner Analysis</title></head><body>',
+        '<h1>Formula 1 Race Winner Analysis</h1>',
+        '<h2>Overall Analysis Graphs</h2>'
+    ]
+    for i, (name, title, _, _) in enumerate(OVERALL_FIGURES, start=1):
+        parts.append(f'<h3>{i}. {html.escape(title)}</h3>')
+        parts.append(f'<img src="overall/{name}.png" alt="{html.escape(title)}" style="max-width:100%">')
+
+    parts.append('<h2>Track-Specific Analysis</h2>')
+    parts.append('<table border="1" cellpadding="4"><tr><th>Grand Prix</th><th>Total Races Analyzed (2014+)</th>'
+                 "<th>Average Winner's Start Position</th><th>Pole to Win Conversion</th></tr>")
+    for track_name, slug, stats in track_rows:
+        parts.append(
+            f'<tr><td><a href="tracks/{slug}.png">{html.escape(track_name)}</a></td>'
+            f"<td>{stats['total_races']}</td>"
+            f"<td>{stats['avg_grid_winner']:.2f}</td>"
+            f"<td>{stats['pole_win_percentage']:.1f}%</td></tr>"
+        )
+    parts.append('</table></body></html>')
+
+    with open(os.path.join(report_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(parts))
+
+# --- Main Report Function ---
+
+def render_report(model_data_df, importance_df, report_dir=REPORT_DIR, max_workers=None):
+    """
+    Renders every overall figure plus a stat panel per Grand Prix to a static report folder.
+    Only outputs whose input data changed since the last run are re-rendered.
+    """
+    os.makedirs(os.path.join(report_dir, 'overall'), exist_ok=True)
+    os.makedirs(os.path.join(report_dir, 'tracks'), exist_ok=True)
+    manifest = _load_manifest(report_dir)
+
+    inputs = {'model': model_data_df, 'importance': importance_df}
+    jobs = []  # (output path relative to report_dir, input hash, plot function, args)
+    for name, _, plot_func, input_key in OVERALL_FIGURES:
+        data = inputs[input_key]
+        jobs.append((f'overall/{name}.png', _hash_inputs(name, data, [plot_func]), plot_func, (data,)))
+
+    track_rows = []
+    for track_name, track_data in model_data_df.groupby('raceName'):
+        slug = _slugify(track_name)
+        track_rows.append((track_name, slug, compute_track_stats(track_data)))
+        jobs.append((f'tracks/{slug}.png', _hash_inputs(track_name, track_data, [plot_track_stats, compute_track_stats]), plot_track_stats, (track_data, track_name)))
+
+    _remove_orphans(report_dir, manifest, {job[0] for job in jobs})
+
+    stale = [
+        job for job in jobs
+        if manifest.get(job[0]) != job[1] or not os.path.exists(os.path.join(report_dir, job[0]))
+    ]
+    print(f"Rendering {len(stale)} of {len(jobs)} report figures ({len(jobs) - len(stale)} unchanged)...")
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_render_figure, plot_func, args, os.path.join(report_dir, rel_path)): (rel_path, input_hash)
+                for rel_path, input_hash, plot_func, args in stale
+            }
+            for future, (rel_path, input_hash) in futures.items():
+                future.result()
+                manifest[rel_path] = input_hash
+
+    _save_manifest(report_dir, manifest)
+    _write_index(report_dir, track_rows)
+    print(f"Report written to: {os.path.join(report_dir, 'index.html')}")
+
+def main():
+    master_df = load_all_data(data_path='data/', min_year=MODEL_MIN_YEAR, columns=ANALYSIS_COLUMNS)
+    if master_df is None:
+        return
+
+    features_df = engineer_features(master_df)
+    model_data_df, importance_df = train_model(features_df)
+
+    render_report(model_data_df, importance_df)
+
+if __name__ == "__main__":
+    main()
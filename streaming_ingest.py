@@ -0,0 +1,164 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import os
+import sys
+
+# Enriched tables are written here as one Parquet file per table
+STORE_PATH = os.path.join('data', 'store')
+
+# Rows per batch; peak memory scales with this, not with the file size
+DEFAULT_BATCH_SIZE = 100_000
+
+# Tables ingested when no table names are given on the command line
+DEFAULT_TABLES = ['results', 'qualifying', 'pit_stops']
+
+# Column types are declared up front so they never depend on what one batch happens to contain.
+# Columns ending in 'Id' are integers, the columns below are numeric, everything else is stored as text
+# (e.g. pit_stops.duration holds both '26.898' and '16:44.718').
+TABLE_COLUMN_TYPES = {
+    'results': {
+        'number': pa.int64(), 'grid': pa.int64(), 'position': pa.int64(), 'positionOrder': pa.int64(),
+        'points': pa.float64(), 'laps': pa.int64(), 'milliseconds': pa.int64(), 'fastestLap': pa.int64(),
+        'rank': pa.int64(), 'fastestLapSpeed': pa.float64()
+    },
+    'sprint_results': {
+        'number': pa.int64(), 'grid': pa.int64(), 'position': pa.int64(), 'positionOrder': pa.int64(),
+        'points': pa.float64(), 'laps': pa.int64(), 'milliseconds': pa.int64(), 'fastestLap': pa.int64()
+    },
+    'qualifying': {'number': pa.int64(), 'position': pa.int64()},
+    'pit_stops': {'stop': pa.int64(), 'lap': pa.int64(), 'milliseconds': pa.int64()},
+    'lap_times': {'lap': pa.int64(), 'position': pa.int64(), 'milliseconds': pa.int64()}
+}
+
+# Columns added by enrich_batch()
+DIMENSION_COLUMN_TYPES = {'year': pa.int64()}
+
+# --- Helper Functions ---
+
+def load_dimensions(data_path='data/'):
+    """
+    Loads the small lookup tables that every batch is joined against (same columns as load_all_data).
+    """
+    races = pd.read_csv(os.path.join(data_path, 'races.csv'), usecols=['raceId', 'year', 'circuitId', 'date', 'name'])
+    circuits = pd.read_csv(os.path.join(data_path, 'circuits.csv'), usecols=['circuitId', 'name', 'location', 'country'])
+    constructors = pd.read_csv(os.path.join(data_path, 'constructors.csv'), usecols=['constructorId', 'name', 'nationality'])
+    status = pd.read_csv(os.path.join(data_path, 'status.csv'))
+    return {
+        'status': status,
+        'races': races[['raceId', 'year', 'circuitId', 'date', 'name']].rename(columns={'name': 'raceName'}),
+        'circuits': circuits,
+        'constructors': constructors.rename(columns={'name': 'constructorName'})
+    }
+
+def enrich_batch(batch, dimensions):
+    """
+    Joins one batch against every lookup table whose key it contains.
+    """
+    if 'statusId' in batch.columns:
+        batch = pd.merge(batch, dimensions['status'], on='statusId', how='left')
+    if 'raceId' in batch.columns:
+        batch = pd.merge(batch, dimensions['races'], on='raceId', how='left')
+    if 'circuitId' in batch.columns:
+        batch = pd.merge(batch, dimensions['circuits'], on='circuitId', how='left')
+    if 'constructorId' in batch.columns:
+        batch = pd.merge(batch, dimensions['constructors'], on='constructorId', how='left')
+    return batch
+
+def _column_types(table, header, column_types=None):
+    """
+    Declared type of every column in the CSV header, plus any overrides passed by the caller.
+    """
+    declared = {**TABLE_COLUMN_TYPES.get(table, {}), **(column_types or {})}
+    return {
+        col: declared.get(col, pa.int64() if col.endswith('Id') else pa.string())
+        for col in header
+    }
+
+def _apply_types(batch, types):
+    """
+    Converts the text columns of a batch to their declared numeric types (raises ValueError on bad values).
+    """
+    for col, col_type in types.items():
+        if col in batch.columns and not pa.types.is_string(col_type):
+            batch[col] = pd.to_numeric(batch[col])
+    return batch
+
+def _store_schema(header_types, dimensions):
+    """
+    Builds the Parquet schema from the CSV header and the lookup tables, before any data is read.
+    """
+    empty = _apply_types(pd.DataFrame({col: pd.Series(dtype=object) for col in header_types}), header_types)
+    columns = enrich_batch(empty, dimensions).columns
+    types = {**header_types, **DIMENSION_COLUMN_TYPES}
+    return pa.schema([(col, types.get(col, pa.int64() if col.endswith('Id') else pa.string())) for col in columns])
+
+# --- Main Ingest Functions ---
+
+def stream_ingest(table, data_path='data/', store_path=STORE_PATH, batch_size=DEFAULT_BATCH_SIZE, usecols=None, column_types=None):
+    """
+    Reads data/<table>.csv in fixed-size batches, enriches each batch and appends it to store/<table>.parquet.
+    Only one batch is held in memory at a time. column_types ({column: pyarrow type}) overrides
+    TABLE_COLUMN_TYPES. Returns the path of the Parquet file (None on failure).
+    """
+    print(f"Streaming '{table}' into the columnar store in batches of {batch_size} rows...")
+    csv_path = os.path.join(data_path, f"{table}.csv")
+    try:
+        dimensions = load_dimensions(data_path)
+        header = pd.read_csv(csv_path, usecols=usecols, nrows=0).columns
+        reader = pd.read_csv(csv_path, usecols=usecols, dtype=str, keep_default_na=False,
+                             na_values=['\\N', ''], chunksize=batch_size)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return None
+
+    types = _column_types(table, header, column_types)
+    schema = _store_schema(types, dimensions)
+
+    os.makedirs(store_path, exist_ok=True)
+    out_file = os.path.join(store_path, f"{table}.parquet")
+    tmp_file = out_file + '.tmp'
+
+    writer = None
+    n_rows = 0
+    try:
+        writer = pq.ParquetWriter(tmp_file, schema)
+        for i, batch in enumerate(reader):
+            try:
+                batch = enrich_batch(_apply_types(batch, types), dimensions)
+                writer.write_table(pa.Table.from_pandas(batch, schema=schema, preserve_index=False))
+            except (ValueError, pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                print(f"Error: batch {i + 1} of '{table}' does not match the declared column types ({e}).")
+                print("Pass column_types={...} to stream_ingest() to change the type of that column.")
+                writer.close()
+                writer = None
+                os.remove(tmp_file)
+                return None
+            n_rows += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if n_rows == 0:
+        print(f"Warning: '{table}' is empty, nothing was written.")
+        os.remove(tmp_file)
+        return None
+
+    os.replace(tmp_file, out_file)
+    print(f"Saved {n_rows} rows to '{out_file}'")
+    return out_file
+
+def load_from_store(table, store_path=STORE_PATH, columns=None, min_year=None, max_year=None):
+    """
+    Reads an ingested table back, pushing the column and season selection down to the Parquet reader.
+    """
+    filters = []
+    if min_year is not None:
+        filters.append(('year', '>=', min_year))
+    if max_year is not None:
+        filters.append(('year', '<=', max_year))
+    return pd.read_parquet(os.path.join(store_path, f"{table}.parquet"), columns=columns, filters=filters or None)
+
+if __name__ == "__main__":
+    for table_name in sys.argv[1:] or DEFAULT_TABLES:
+        stream_ingest(table_name)
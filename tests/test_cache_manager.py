@@ -0,0 +1,96 @@
+import sqlite3
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import pytest
+import requests_cache
+import cache_manager
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'x' * 1000
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = HTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+
+
+def test_http_hit_rate_counts_each_request_once(tmp_path, server_url):
+    stats = cache_manager.new_cache_stats()
+    session = cache_manager.setup_http_cache(str(tmp_path / 'http'), stats=stats)
+
+    n = 3
+    for _ in range(2):
+        for i in range(n):
+            session.get(f'{server_url}/{i}')
+
+    assert stats['http_misses'] == n
+    assert stats['http_hits'] == n
+    assert stats['http_bytes_saved'] == n * 1000
+    with sqlite3.connect(session.cache.responses.db_path) as conn:
+        assert conn.execute(f'SELECT COUNT(*) FROM {cache_manager.ACCESS_TABLE}').fetchone()[0] == n
+
+
+def test_http_cache_limit_evicts_least_recently_used(tmp_path, server_url):
+    session = cache_manager.setup_http_cache(str(tmp_path / 'http'))
+    for i in range(5):
+        session.get(f'{server_url}/{i}')
+    session.get(f'{server_url}/0')  # Make the first response the most recently used
+
+    with sqlite3.connect(session.cache.responses.db_path) as conn:
+        entry_size = conn.execute('SELECT MAX(length(value)) FROM responses').fetchone()[0]
+    cache_manager.enforce_http_cache_limit(session, 2 * entry_size)
+
+    urls = {response.url for response in session.cache.responses.values()}
+    assert urls == {f'{server_url}/0', f'{server_url}/4'}
+
+
+def test_fastf1_season_eviction_keeps_recently_used_season(tmp_path):
+    cache_path = tmp_path / 'cache'
+    session_dirs = {}
+    for year in ['2021', '2022']:
+        session_dirs[year] = cache_path / year / 'event' / 'race'
+        session_dirs[year].mkdir(parents=True)
+        (session_dirs[year] / 'laps.ff1pkl').write_bytes(b'0' * 1000)
+        time.sleep(0.05)
+
+    # A cache hit on 2021 only touches its session folder, not the files inside it
+    stats = cache_manager.new_cache_stats()
+    cache_manager.record_fastf1_session(stats, str(session_dirs['2021']), 1000)
+    cache_manager.enforce_fastf1_cache_limit(str(cache_path), max_bytes=1000, http_max_bytes=0, granularity='season')
+
+    assert (cache_path / '2021').exists()
+    assert not (cache_path / '2022').exists()
+
+
+def test_fastf1_http_store_is_capped_without_emptying_sessions(tmp_path, server_url):
+    cache_path = tmp_path / 'cache'
+    session_dir = cache_path / '2023' / 'event' / 'race'
+    session_dir.mkdir(parents=True)
+    (session_dir / 'laps.ff1pkl').write_bytes(b'0' * 1000)
+
+    # Fill FastF1's raw HTTP store well beyond its cap
+    http_session = requests_cache.CachedSession(str(cache_path / 'fastf1_http_cache'), expire_after=-1)
+    for i in range(20):
+        http_session.get(f'{server_url}/{i}')
+    http_session.close()
+
+    cache_manager.enforce_fastf1_cache_limit(str(cache_path), max_bytes=10_000, http_max_bytes=5000)
+
+    assert session_dir.exists()
+    with sqlite3.connect(cache_path / cache_manager.FASTF1_HTTP_CACHE_FILE) as conn:
+        stored = conn.execute('SELECT SUM(length(value)) FROM responses').fetchone()[0]
+    assert stored <= 5000
@@ -0,0 +1,48 @@
+import os
+import shutil
+import time
+import pandas as pd
+import pytest
+from data_loader import load_all_data, partition_by_year, ANALYSIS_COLUMNS
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', '')
+COLUMNS = ANALYSIS_COLUMNS + ['status', 'constructorName', 'qualifyingPosition']
+
+
+def _expected(min_year, max_year):
+    full = load_all_data(data_path=DATA_PATH)
+    rows = full[(full['year'] >= min_year) & (full['year'] <= max_year)]
+    return rows[[col for col in full.columns if col in COLUMNS]].reset_index(drop=True)
+
+
+@pytest.fixture
+def partitioned_data(tmp_path):
+    data_path = str(tmp_path / 'data') + os.sep
+    shutil.copytree(DATA_PATH, data_path)
+    partition_by_year(data_path)
+    return data_path
+
+
+@pytest.mark.parametrize('min_year, max_year', [(2014, 2024), (1990, 2005)])
+def test_pushdown_matches_filtered_full_load(min_year, max_year):
+    loaded = load_all_data(data_path=DATA_PATH, min_year=min_year, max_year=max_year, columns=COLUMNS)
+    pd.testing.assert_frame_equal(loaded, _expected(min_year, max_year), check_dtype=False)
+
+
+@pytest.mark.parametrize('min_year, max_year', [(2014, 2024), (1990, 2005)])
+def test_partitioned_layout_matches_filtered_full_load(partitioned_data, min_year, max_year):
+    loaded = load_all_data(data_path=partitioned_data, min_year=min_year, max_year=max_year, columns=COLUMNS)
+    pd.testing.assert_frame_equal(loaded, _expected(min_year, max_year), check_dtype=False)
+
+
+def test_stale_partitions_fall_back_to_csv(partitioned_data, capsys):
+    results_csv = os.path.join(partitioned_data, 'results.csv')
+    stale_partition = os.path.join(partitioned_data, 'by_year', 'results', '2020.csv')
+    pd.read_csv(stale_partition).iloc[:0].to_csv(stale_partition, index=False)  # Partition loses its rows
+    later = time.time() + 10
+    os.utime(results_csv, (later, later))
+
+    loaded = load_all_data(data_path=partitioned_data, min_year=2014, max_year=2024, columns=COLUMNS)
+
+    assert 'older than' in capsys.readouterr().out
+    pd.testing.assert_frame_equal(loaded, _expected(2014, 2024), check_dtype=False)
@@ -0,0 +1,43 @@
+import os
+import pandas as pd
+import pytest
+from data_loader import load_all_data
+from streaming_ingest import stream_ingest, load_from_store
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', '')
+KEYS = ['raceId', 'driverId', 'resultId']
+
+
+def _normalise(df):
+    """
+    Puts both frames on equal footing: load_all_data keeps '\\N' strings and pandas-inferred dtypes.
+    """
+    df = df.sort_values(by=KEYS).reset_index(drop=True).replace('\\N', None)
+    for col in df.columns:
+        try:
+            df[col] = pd.to_numeric(df[col]).astype(float)
+        except (ValueError, TypeError):
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+    return df
+
+
+@pytest.mark.parametrize('batch_size', [1000, 4096])
+def test_results_ingest_matches_load_all_data(tmp_path, batch_size):
+    assert stream_ingest('results', data_path=DATA_PATH, store_path=str(tmp_path), batch_size=batch_size)
+
+    stored = load_from_store('results', store_path=str(tmp_path))
+    expected = load_all_data(data_path=DATA_PATH).drop(columns=['qualifyingPosition'])
+
+    assert list(stored.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(_normalise(stored), _normalise(expected))
+
+
+def test_pit_stops_ingest_with_mixed_duration_formats(tmp_path):
+    assert stream_ingest('pit_stops', data_path=DATA_PATH, store_path=str(tmp_path), batch_size=1000)
+
+    stored = load_from_store('pit_stops', store_path=str(tmp_path))
+    raw = pd.read_csv(os.path.join(DATA_PATH, 'pit_stops.csv'), dtype=str)
+
+    assert len(stored) == len(raw)
+    assert stored['duration'].tolist() == raw['duration'].tolist()
+    assert stored['year'].notna().all()